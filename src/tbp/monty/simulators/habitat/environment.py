@@ -9,7 +9,7 @@
 # https://opensource.org/licenses/MIT.
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, is_dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from typing import TYPE_CHECKING, Sequence
 
 from tbp.monty.frameworks.actions.actions import Action
@@ -44,6 +44,18 @@ __all__ = [
 ]
 
 
+def _fields_dict(config) -> dict:
+    """Return the top-level fields of a dataclass instance as a dict.
+
+    Unlike :func:`dataclasses.asdict`, field values are not recursively copied, which
+    is all that is needed to splat a config into a constructor.
+
+    Returns:
+        Mapping of field names to field values.
+    """
+    return {f.name: getattr(config, f.name) for f in fields(config)}
+
+
 # Create agent and object configuration helper dataclasses
 
 # ObjectConfig dataclass based on the arguments of `HabitatSim.add_object` method
@@ -106,11 +118,11 @@ class HabitatEnvironment(SimulatedObjectEnvironment):
         agents = [agents]
         self._agents = []
         for config in agents:
-            cfg_dict = asdict(config) if is_dataclass(config) else config
+            cfg_dict = _fields_dict(config) if is_dataclass(config) else config
             agent_type = cfg_dict["agent_type"]
             args = cfg_dict["agent_args"]
             if is_dataclass(args):
-                args = asdict(args)
+                args = _fields_dict(args)
             agent = agent_type(**args)
             self._agents.append(agent)
 
@@ -123,7 +135,7 @@ class HabitatEnvironment(SimulatedObjectEnvironment):
 
         if objects is not None:
             for obj in objects:
-                obj_dict = asdict(obj) if is_dataclass(obj) else obj
+                obj_dict = _fields_dict(obj) if is_dataclass(obj) else obj
                 self._env.add_object(**obj_dict)
 
     def add_object(
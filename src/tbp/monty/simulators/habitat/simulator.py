@@ -84,6 +84,24 @@ PRIMITIVE_OBJECT_TYPES = {
     "uvSphereSolid": 106,
 }
 
+#: Action types that :meth:`HabitatSim.step` knows how to actuate
+_SUPPORTED_ACTION_TYPES = (
+    LookDown,
+    LookUp,
+    MoveForward,
+    MoveTangentially,
+    OrientHorizontal,
+    OrientVertical,
+    SetAgentPitch,
+    SetAgentPose,
+    SetSensorPitch,
+    SetSensorPose,
+    SetSensorRotation,
+    SetYaw,
+    TurnLeft,
+    TurnRight,
+)
+
 
 class HabitatSim(HabitatActuator, Simulator):
     """habitat-sim interface for tbp.monty.
@@ -533,25 +551,7 @@ class HabitatSim(HabitatActuator, Simulator):
             # TODO: This is for the purpose of type checking, but would be better
             #       handled using the action space check above, once those are
             #       integrated into the type system.
-            if not isinstance(
-                action,
-                (
-                    LookDown,
-                    LookUp,
-                    MoveForward,
-                    MoveTangentially,
-                    OrientHorizontal,
-                    OrientVertical,
-                    SetAgentPitch,
-                    SetAgentPose,
-                    SetSensorPitch,
-                    SetSensorPose,
-                    SetSensorRotation,
-                    SetYaw,
-                    TurnLeft,
-                    TurnRight,
-                ),
-            ):
+            if not isinstance(action, _SUPPORTED_ACTION_TYPES):
                 raise TypeError(f"Invalid action type: {type(action)}")
 
             action.act(self)
@@ -35,6 +35,18 @@ INDENTATION_UNIT = "  "  # Single indentation level
 # URLs that are checked
 README_URL = "https://thousandbrainsproject.readme.io"
 
+regex_md_links = re.compile(r"\[([^\]]*)\]\(([^)]+\.md(?:#[^)]*)?)\)")
+regex_figures = re.compile(
+    r"(?:\.\./)*figures/[^\s\)\"\']+(?:\.png|\.jpg|\.jpeg|\.gif|\.svg|\.webp|\s)"
+)
+regex_external_links = (
+    re.compile(r"\[[^\]]*\]\(([^)]+)\)"),
+    re.compile(r'<a[^>]+href="([^"]+)"'),
+    re.compile(r"<a[^>]+href=\'([^\']+)\'"),
+    re.compile(r'<img[^>]+src="([^"]+)"'),
+    re.compile(r"<img[^>]+src=\'([^\']+)\'"),
+)
+
 
 def create_hierarchy_file(output_dir, hierarchy):
     output_dir = Path(output_dir)
@@ -146,15 +158,11 @@ def check_links(path):
         content = f.read()
     file_name = path.name
 
-    regex_md_links = r"\[([^\]]*)\]\(([^)]+\.md(?:#[^)]*)?)\)"
-    md_link_matches = re.findall(regex_md_links, content)
+    md_link_matches = regex_md_links.findall(content)
 
-    table_matches = re.findall(REGEX_CSV_TABLE, content)
+    table_matches = REGEX_CSV_TABLE.findall(content)
 
-    regex_figures = (
-        r"(?:\.\./)*figures/[^\s\)\"\']+(?:\.png|\.jpg|\.jpeg|\.gif|\.svg|\.webp|\s)"
-    )
-    image_link_matches = re.findall(regex_figures, content)
+    image_link_matches = regex_figures.findall(content)
     logging.debug(
         f"{WHITE}{file_name}"
         f"{GREEN} {len(md_link_matches)} links"
@@ -257,13 +265,10 @@ def process_file(file_path, rdme, url_cache):
 
 
 def extract_external_links(content):
-    return (
-        re.findall(r"\[[^\]]*\]\(([^)]+)\)", content)
-        + re.findall(r'<a[^>]+href="([^"]+)"', content)
-        + re.findall(r"<a[^>]+href=\'([^\']+)\'", content)
-        + re.findall(r'<img[^>]+src="([^"]+)"', content)
-        + re.findall(r"<img[^>]+src=\'([^\']+)\'", content)
-    )
+    links = []
+    for regex in regex_external_links:
+        links.extend(regex.findall(content))
+    return links
 
 
 def is_readme_url(url):
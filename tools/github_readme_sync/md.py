@@ -10,6 +10,12 @@
 
 import yaml
 
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def process_markdown(body: str, slug: str) -> dict:
     doc = {"title": "", "body": "", "hidden": False, "slug": slug}
@@ -33,5 +39,5 @@ def process_markdown(body: str, slug: str) -> dict:
 def parse_frontmatter(file_content):
     if file_content.startswith("---"):
         _, frontmatter, _ = file_content.split("---", 2)
-        return yaml.safe_load(frontmatter)
+        return yaml.load(frontmatter, Loader=SafeLoader)
     return {}